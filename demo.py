@@ -1,10 +1,16 @@
 import os
 
+from langchain.globals import set_llm_cache
 from langchain.prompts import FewShotPromptTemplate, PromptTemplate
+from langchain_community.cache import SQLiteCache
 from langchain_openai import ChatOpenAI
 
 from few_shot_exemplars.langchain_validator import ExemplarValidator
 
+# Reuse responses for identical prompts across the validator runs below and
+# across reruns of this script
+set_llm_cache(SQLiteCache(database_path=".langchain.db"))
+
 example_prompt = PromptTemplate.from_template("Q: {question}\nA: {answer}")
 
 examples = [
@@ -41,6 +47,8 @@ prompt = FewShotPromptTemplate(
 llm = ChatOpenAI(
     model=os.environ["OPENAI_MODEL"],
     temperature=0.0,
+    # Answers are a short name/flag/age; capping output keeps latency down
+    max_tokens=64,
     extra_body=(
         {"reasoning_effort": "minimal"}
         if os.environ["OPENAI_MODEL"].startswith("gpt-5")
@@ -51,30 +59,30 @@ llm = ChatOpenAI(
 validator = ExemplarValidator(prompt, llm)
 
 # Ablation method
-ablation_result = validator.ablation_test()
 print("Ablation test results (original examples):")
-print(ablation_result)
-print("\n")
+for diff in validator.iablation_test():
+    print(diff, end="\n\n", flush=True)
+print()
 
 ablated_prompt = prompt.model_copy()
 ablated_prompt.examples = validator.ablation_examples()
 ablated_validator = ExemplarValidator(ablated_prompt, llm)
 
-updated_ablation_result = ablated_validator.ablation_test()
 print("Ablation test results (ablated examples):")
-print(updated_ablation_result)
-print("\n")
+for diff in ablated_validator.iablation_test():
+    print(diff, end="\n\n", flush=True)
+print()
 
 # Replay method
-replay_result = validator.replay_test()
 print("Replay test results (original examples):")
-print(replay_result)
-print("\n")
+for diff in validator.ireplay_test():
+    print(diff, end="\n\n", flush=True)
+print()
 
 replayed_prompt = prompt.model_copy()
 replayed_prompt.examples = validator.replay_examples()
 replayed_validator = ExemplarValidator(replayed_prompt, llm)
 
-updated_replay_result = replayed_validator.replay_test()
 print("Replay test results (replayed examples):")
-print(updated_replay_result)
+for diff in replayed_validator.ireplay_test():
+    print(diff, end="\n\n", flush=True)
@@ -3,24 +3,50 @@
 
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _run_captured(cmd):
+    """Run a command, capturing its output so parallel runs don't interleave."""
+    return subprocess.run(cmd, capture_output=True, text=True)
 
 
 def check_all():
-    """Run all code quality checks: black, flake8, isort, mypy, and pytest."""
-    commands = [
+    """Run all code quality checks: black, flake8, isort, mypy, and pytest.
+
+    The linters are independent, so they run in parallel; pytest runs after them.
+    """
+    lint_commands = [
         ["black", "--check", "few_shot_exemplars"],
         ["flake8", "--extend-ignore=E501", "few_shot_exemplars"],
         ["isort", "--check-only", "few_shot_exemplars"],
         ["mypy", "few_shot_exemplars"],
-        ["pytest"],
     ]
+    failures = []
 
-    for cmd in commands:
-        print(f"Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd)
-        if result.returncode != 0:
+    print("Running in parallel:")
+    for cmd in lint_commands:
+        print(f"  {' '.join(cmd)}")
+
+    with ThreadPoolExecutor(max_workers=len(lint_commands)) as pool:
+        results = pool.map(_run_captured, lint_commands)
+        for cmd, result in zip(lint_commands, results):
+            print(f"== {cmd[0]} ==", flush=True)
+            print(result.stdout, end="")
+            print(result.stderr, end="", file=sys.stderr)
+            if result.returncode != 0:
+                failures.append((cmd, result.returncode))
+
+    cmd = ["pytest"]
+    print(f"Running: {' '.join(cmd)}")
+    result = subprocess.run(cmd)
+    if result.returncode != 0:
+        failures.append((cmd, result.returncode))
+
+    if failures:
+        for cmd, _ in failures:
             print(f"Command failed: {' '.join(cmd)}")
-            sys.exit(result.returncode)
+        sys.exit(failures[0][1])
 
     print("All checks passed!")
 
@@ -1,8 +1,60 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Sequence
-
-from langchain.prompts import FewShotPromptTemplate
+import asyncio
+import difflib
+import hashlib
+import logging
+import re
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from langchain.prompts import FewShotPromptTemplate
+
+logger = logging.getLogger(__name__)
+
+_INPUT_SENTINEL = "\x00"
+_CHECK_SENTINEL = "\x01"
+_LONG_ANSWER_THRESHOLD = 256
+_BATCH_INSTRUCTION = "Answer each numbered question on its own line."
+_NUMBERED_ANSWER_RE = re.compile(r"^\s*(\d+)[.)]\s*(.*)$")
+# Cached properties computed from the examples, dropped when examples change
+_EXAMPLE_DERIVED = (
+    "_example_keys",
+    "_prompt_prefix",
+    "_questions",
+    "_answers",
+    "_ablated_prompts",
+    "_ablated_prompt_renders",
+)
+# Cached properties computed from the prompt, dropped when the prompt changes
+_PROMPT_DERIVED = (
+    "_static_prefix",
+    "_prompt_prefix",
+    "_ablated_prompts",
+    "_prompt_render",
+    "_ablated_prompt_renders",
+)
+# Cached properties computed from the LLM, dropped when the LLM changes
+_LLM_DERIVED = ("_answer_llm",)
+
+
+@lru_cache(maxsize=None)
+def _prefix_pattern(question_key: str, answer_key: str) -> re.Pattern[str]:
+    """Compile the pattern capturing the text between question and answer fields."""
+    question_field = re.escape(f"{{{question_key}}}")
+    answer_field = re.escape(f"{{{answer_key}}}")
+    return re.compile(rf"{question_field}\s*(.*?)(?:{answer_field}|\s*\Z)", re.DOTALL)
+
+
+def _prompt_value(text: str) -> Any:
+    """Wrap rendered text as the prompt value a prompt template would pass an LLM."""
+    # Imported here so importing the package doesn't pull in all of LangChain
+    from langchain_core.prompt_values import StringPromptValue
+
+    return StringPromptValue(text=text)
 
 
 class ExemplarValidator:
@@ -13,62 +65,413 @@ class ExemplarValidator:
         prompt: FewShotPromptTemplate,
         llm: Any,
         examples: Optional[Sequence[Dict[str, Any]]] = None,
+        max_concurrency: Optional[int] = None,
+        batch_prompting: bool = False,
+        answer_max_tokens: Optional[int] = None,
     ) -> None:
         self.prompt = prompt
         self.llm = llm
         self.examples = examples or prompt.examples or []
+        self.max_concurrency = max_concurrency
+        self.batch_prompting = batch_prompting
+        self.answer_max_tokens = answer_max_tokens
+        if logger.isEnabledFor(logging.DEBUG) and self.rendered_prefix is not None:
+            logger.debug(
+                "Rendered prompt prefix sha256: %s",
+                hashlib.sha256(self.rendered_prefix.encode()).hexdigest(),
+            )
+
+    def _invalidate(self, names: Iterable[str]) -> None:
+        """Drop cached answers along with the named cached properties."""
+        self._answer_cache: Dict[str, List[str]] = {}
+        for name in names:
+            self.__dict__.pop(name, None)
+
+    @property
+    def prompt(self) -> FewShotPromptTemplate:
+        """The prompt whose examples are being validated."""
+        return self._prompt
+
+    @prompt.setter
+    def prompt(self, prompt: FewShotPromptTemplate) -> None:
+        # Assigning a new prompt drops everything rendered from the old one;
+        # in-place edits to the prompt are not detected
+        self._prompt = prompt
+        self._invalidate(_PROMPT_DERIVED)
+
+    @property
+    def llm(self) -> Any:
+        """The LLM used to answer the example questions."""
+        return self._llm
+
+    @llm.setter
+    def llm(self, llm: Any) -> None:
+        self._llm = llm
+        self._invalidate(_LLM_DERIVED)
+
+    @property
+    def batch_prompting(self) -> bool:
+        """Whether replay answers every question in a single LLM call."""
+        return self._batch_prompting
+
+    @batch_prompting.setter
+    def batch_prompting(self, batch_prompting: bool) -> None:
+        self._batch_prompting = batch_prompting
+        self._invalidate(())
+
+    @property
+    def answer_max_tokens(self) -> Optional[int]:
+        """The max_tokens bound to the LLM per expected answer, if any."""
+        return self._answer_max_tokens
+
+    @answer_max_tokens.setter
+    def answer_max_tokens(self, answer_max_tokens: Optional[int]) -> None:
+        self._answer_max_tokens = answer_max_tokens
+        self._invalidate(_LLM_DERIVED)
+
+    @property
+    def examples(self) -> Sequence[Dict[str, Any]]:
+        """The examples being validated."""
+        return self._examples
+
+    @examples.setter
+    def examples(self, examples: Sequence[Dict[str, Any]]) -> None:
+        # Assigning new examples drops everything computed from the old ones;
+        # in-place edits to the examples are not detected
+        self._examples = examples
+        self._invalidate(_EXAMPLE_DERIVED)
+
+    @cached_property
+    def _static_prefix(self) -> Optional[str]:
+        """Everything the prompt renders before the per-call input, computed once."""
+        parts = self._static_parts(self.prompt)
+        return parts[0] if parts is not None else None
+
+    @property
+    def rendered_prefix(self) -> Optional[str]:
+        """The static text sent ahead of every replayed question.
+
+        The prefix, examples and example order all come from the prompt as given,
+        so this text is byte-identical across calls and runs. That lets providers
+        that cache by prompt prefix reuse it; compare it (or the sha256 logged at
+        DEBUG level on init) to confirm it stays stable.
+
+        None if the prompt has no such static text, e.g. when an example selector
+        picks the examples per question.
+        """
+        return self._static_prefix
+
+    def _get_max_concurrency(self) -> int:
+        """Return the number of LLM calls allowed in flight at once."""
+        return self.max_concurrency or max(len(self.examples), 1)
 
     def _validate_examples(self) -> None:
         """Validate that examples are available."""
         if not self.examples:
             raise ValueError("No examples available")
 
-    def _get_example_keys(self) -> tuple[str, str]:
-        """Extract question and answer keys from the examples."""
+    @cached_property
+    def _example_keys(self) -> tuple[str, str]:
+        """Question and answer keys of the examples, computed once."""
         self._validate_examples()
         first_example = self.examples[0]
         keys = list(first_example.keys())
         return keys[0], keys[1]
 
-    def _get_prompt_prefix(self) -> str:
-        """Extract the prompt prefix for cleaning LLM responses."""
+    @cached_property
+    def _prompt_prefix(self) -> str:
+        """Prompt prefix for cleaning LLM responses, computed once."""
         example_question_key, example_answer_key = self._get_example_keys()
-        return (
-            self.prompt.example_prompt.template.split(f"{{{example_question_key}}}")[1]
-            .strip()
-            .split(f"{{{example_answer_key}}}")[0]
+        pattern = _prefix_pattern(example_question_key, example_answer_key)
+        match = pattern.search(self.prompt.example_prompt.template)
+        return match.group(1) if match else ""
+
+    @cached_property
+    def _questions(self) -> tuple[str, ...]:
+        """Each example's question, pulled out of the example dicts once."""
+        example_question_key, _ = self._get_example_keys()
+        return tuple(example[example_question_key] for example in self.examples)
+
+    @cached_property
+    def _answers(self) -> tuple[str, ...]:
+        """Each example's answer as compared against the LLM, computed once."""
+        _, example_answer_key = self._get_example_keys()
+        return tuple(
+            str(example[example_answer_key]).strip() for example in self.examples
         )
 
+    def _get_example_keys(self) -> tuple[str, str]:
+        """Extract question and answer keys from the examples."""
+        return self._example_keys
+
+    def _get_prompt_prefix(self) -> str:
+        """Extract the prompt prefix for cleaning LLM responses."""
+        return self._prompt_prefix
+
     def _create_ablated_prompt(self, exclude_index: int) -> FewShotPromptTemplate:
         """Create a prompt with the example at exclude_index removed."""
         self._validate_examples()
-        ablated_examples = [
-            ex for j, ex in enumerate(self.examples) if j != exclude_index
-        ]
-        return FewShotPromptTemplate(
-            examples=ablated_examples,
-            example_prompt=self.prompt.example_prompt,
-            prefix=self.prompt.prefix,
-            suffix=self.prompt.suffix,
-            input_variables=self.prompt.input_variables,
-        )
+        next_index = exclude_index + 1
+        ablated_examples = list(self.examples[:exclude_index])
+        ablated_examples.extend(self.examples[next_index:])
+        return self.prompt.model_copy(update={"examples": ablated_examples})
+
+    @cached_property
+    def _ablated_prompts(self) -> List[FewShotPromptTemplate]:
+        """One ablated prompt per example, built once and shared across calls."""
+        return [self._create_ablated_prompt(i) for i in range(len(self.examples))]
+
+    def _split_at_input(self, prompt: FewShotPromptTemplate) -> List[str]:
+        """Render a prompt once, split around every place the input goes."""
+        prompt_input_key = prompt.input_variables[0]
+        rendered = prompt.format(**{prompt_input_key: _INPUT_SENTINEL})
+        return rendered.split(_INPUT_SENTINEL)
+
+    def _static_parts(self, prompt: FewShotPromptTemplate) -> Optional[List[str]]:
+        """Split a prompt's rendering around its input, if splicing can reproduce it.
 
-    def _invoke_llm(self, prompt: FewShotPromptTemplate, question: str) -> str:
-        """Invoke the LLM with a given prompt and question, returning cleaned response."""
+        Returns None for prompts that select examples per input or compute partial
+        variables per render, and for templates that transform the input (such as
+        {input!r}); a check render with a second sentinel catches the latter.
+        """
+        if prompt.example_selector is not None:
+            return None
+        if any(callable(value) for value in prompt.partial_variables.values()):
+            return None
+        parts = self._split_at_input(prompt)
         prompt_input_key = prompt.input_variables[0]
+        check = prompt.format(**{prompt_input_key: _CHECK_SENTINEL})
+        if len(parts) < 2 or _CHECK_SENTINEL.join(parts) != check:
+            return None
+        return parts
+
+    def _precompile_prompt(self, prompt: FewShotPromptTemplate) -> Callable[[str], str]:
+        """Return a renderer that only splices the question into the static text.
+
+        Prompts that can't be rendered by splicing are still rendered in full.
+        """
+        parts = self._static_parts(prompt)
+        if parts is None:
+            prompt_input_key = prompt.input_variables[0]
+            return lambda question: prompt.format(**{prompt_input_key: question})
+        return lambda question: question.join(parts)
+
+    @cached_property
+    def _prompt_render(self) -> Callable[[str], str]:
+        """Renderer for the full prompt, precompiled once."""
+        return self._precompile_prompt(self.prompt)
+
+    @cached_property
+    def _ablated_prompt_renders(self) -> List[Callable[[str], str]]:
+        """Renderers for the ablated prompts, precompiled once."""
+        return [self._precompile_prompt(prompt) for prompt in self._ablated_prompts]
+
+    def _limit_answer_tokens(self, answer_count: int = 1) -> Any:
+        """Return the LLM, capped at answer_max_tokens per expected answer if set."""
+        from langchain_core.runnables.base import coerce_to_runnable
+
+        llm: Any = coerce_to_runnable(self.llm)
+        if self.answer_max_tokens is None:
+            return llm
+        return llm.bind(max_tokens=self.answer_max_tokens * answer_count)
+
+    @cached_property
+    def _answer_llm(self) -> Any:
+        """The LLM used for single answers, built once."""
+        return self._limit_answer_tokens()
+
+    def _batched_llm(self, answer_count: int) -> Any:
+        """The LLM, with room for answer_count answers in one response."""
+        if self.answer_max_tokens is None:
+            return self._answer_llm
+        return self._limit_answer_tokens(answer_count)
+
+    def _clean_response(self, content: str) -> str:
+        """Strip the prompt prefix and whitespace from an LLM response."""
         prompt_prefix = self._get_prompt_prefix()
-        chain = prompt | self.llm
-        return (
-            chain.invoke({prompt_input_key: question})
-            .content.strip()
-            .replace(prompt_prefix, "")
+        return content.strip().removeprefix(prompt_prefix)
+
+    def _invoke_llm(self, text: str) -> str:
+        """Invoke the LLM with a rendered prompt, returning cleaned response."""
+        response = self._answer_llm.invoke(_prompt_value(text))
+        return self._clean_response(response.content)
+
+    def _invoke_all(self, rendered: Sequence[str]) -> Iterator[str]:
+        """Invoke the LLM concurrently for rendered prompts, yielding answers in order.
+
+        Identical prompts share a single LLM call. Each answer is yielded as soon as
+        it and every answer before it have arrived.
+        """
+        with ThreadPoolExecutor(max_workers=self._get_max_concurrency()) as pool:
+            futures: Dict[str, Future[str]] = {}
+            for text in rendered:
+                if text not in futures:
+                    futures[text] = pool.submit(self._invoke_llm, text)
+            for text in rendered:
+                yield futures[text].result()
+
+    async def _ainvoke_llm(self, text: str, semaphore: asyncio.Semaphore) -> str:
+        """Asynchronously invoke the LLM, waiting on semaphore for a free slot."""
+        async with semaphore:
+            response = await self._answer_llm.ainvoke(_prompt_value(text))
+        return self._clean_response(response.content)
+
+    async def _ainvoke_all(self, rendered: Sequence[str]) -> List[str]:
+        """Async counterpart of _invoke_all()."""
+        semaphore = asyncio.Semaphore(self._get_max_concurrency())
+        unique = list(dict.fromkeys(rendered))
+        results = await asyncio.gather(
+            *[self._ainvoke_llm(text, semaphore) for text in unique]
         )
+        answers = dict(zip(unique, results))
+        return [answers[text] for text in rendered]
+
+    def _format_batched_questions(self, questions: Sequence[str]) -> str:
+        """Pack questions into a single numbered-list input for batch prompting."""
+        lines = [_BATCH_INSTRUCTION]
+        lines.extend(f"{n}. {question}" for n, question in enumerate(questions, 1))
+        return "\n".join(lines)
+
+    def _parse_batched_answers(self, content: str, count: int) -> Optional[List[str]]:
+        """Split a numbered-list response into answers, or None if any are missing."""
+        answers: Dict[int, str] = {}
+        for line in content.splitlines():
+            match = _NUMBERED_ANSWER_RE.match(line)
+            if match:
+                answers[int(match.group(1))] = self._clean_response(match.group(2))
+        if sorted(answers) != list(range(1, count + 1)):
+            return None
+        return [answers[n] for n in range(1, count + 1)]
+
+    def _replay_texts(self, questions: Sequence[str]) -> List[str]:
+        """Render the full prompt for each question."""
+        return [self._prompt_render(question) for question in questions]
+
+    def _ablation_texts(self) -> List[str]:
+        """Render each example question with that example ablated."""
+        return [
+            render(question)
+            for render, question in zip(self._ablated_prompt_renders, self._questions)
+        ]
+
+    def _should_batch(self, questions: Sequence[str]) -> bool:
+        """Whether to answer the questions in a single batch-prompted call."""
+        return self.batch_prompting and len(questions) > 1
+
+    def _batched_request(self, questions: Sequence[str]) -> tuple[Any, Any]:
+        """The LLM and prompt value that ask all questions in one call.
+
+        Batch prompting saves a round-trip per question at the cost of a longer
+        response.
+        """
+        text = self._prompt_render(self._format_batched_questions(questions))
+        return self._batched_llm(len(questions)), _prompt_value(text)
+
+    def _batched_replay(self, questions: Sequence[str]) -> List[str]:
+        """Answer all questions with the full prompt in a single LLM call.
+
+        Falls back to one call per question if the response can't be split into
+        one answer per question.
+        """
+        llm, prompt_value = self._batched_request(questions)
+        content = llm.invoke(prompt_value).content
+        answers = self._parse_batched_answers(content, len(questions))
+        if answers is None:
+            answers = list(self._invoke_all(self._replay_texts(questions)))
+        return answers
+
+    async def _abatched_replay(self, questions: Sequence[str]) -> List[str]:
+        """Async counterpart of _batched_replay()."""
+        llm, prompt_value = self._batched_request(questions)
+        content = (await llm.ainvoke(prompt_value)).content
+        answers = self._parse_batched_answers(content, len(questions))
+        if answers is None:
+            answers = await self._ainvoke_all(self._replay_texts(questions))
+        return answers
+
+    def _get_cached_answers(self, kind: str) -> Optional[List[str]]:
+        """Return the answers from the last complete run of kind, if any."""
+        return self._answer_cache.get(kind)
+
+    def _collect_answers(self, kind: str, answers: Iterable[str]) -> Iterator[str]:
+        """Yield answers, caching them for kind once every answer has arrived."""
+        collected: List[str] = []
+        for answer in answers:
+            collected.append(answer)
+            yield answer
+        self._answer_cache[kind] = collected
+
+    def _replay_answers(self) -> Iterator[str]:
+        """Answer every example question with the full prompt, in example order.
+
+        The calls run concurrently unless batch prompting is enabled.
+        """
+        cached = self._get_cached_answers("replay")
+        if cached is not None:
+            return iter(cached)
+        questions = self._questions
+        if self._should_batch(questions):
+            answers: Iterable[str] = self._batched_replay(questions)
+        else:
+            answers = self._invoke_all(self._replay_texts(questions))
+        return self._collect_answers("replay", answers)
+
+    async def _areplay_answers(self) -> List[str]:
+        """Async counterpart of _replay_answers()."""
+        cached = self._get_cached_answers("replay")
+        if cached is not None:
+            return cached
+        questions = self._questions
+        if self._should_batch(questions):
+            answers = await self._abatched_replay(questions)
+        else:
+            answers = await self._ainvoke_all(self._replay_texts(questions))
+        return list(self._collect_answers("replay", answers))
+
+    def _ablation_answers(self) -> Iterator[str]:
+        """Answer each example question with that example ablated, in example order.
+
+        Every question uses its own ablated prompt; the calls run concurrently.
+        """
+        cached = self._get_cached_answers("ablation")
+        if cached is not None:
+            return iter(cached)
+        return self._collect_answers(
+            "ablation", self._invoke_all(self._ablation_texts())
+        )
+
+    async def _aablation_answers(self) -> List[str]:
+        """Async counterpart of _ablation_answers()."""
+        cached = self._get_cached_answers("ablation")
+        if cached is not None:
+            return cached
+        answers = await self._ainvoke_all(self._ablation_texts())
+        return list(self._collect_answers("ablation", answers))
 
     def _create_diff(self, question: str, expected: str, actual: str) -> str:
         """Create a diff string for answers."""
         if expected == actual:
             return "\n".join([f"# Q: {question}", "# (identical)"])
 
+        expected_lines = expected.splitlines()
+        actual_lines = actual.splitlines()
+        is_long = max(len(expected), len(actual)) > _LONG_ANSWER_THRESHOLD
+        if is_long and max(len(expected_lines), len(actual_lines)) > 1:
+            # Long multi-line answers get a line-level diff so unchanged lines
+            # aren't repeated
+            line_diff = list(
+                difflib.unified_diff(
+                    expected_lines,
+                    actual_lines,
+                    fromfile="expected",
+                    tofile="actual",
+                    lineterm="",
+                )
+            )
+            # Answers differing only in line endings split into equal lines
+            if line_diff:
+                return "\n".join([f"# Q: {question}", *line_diff])
+
         return "\n".join(
             [
                 f"# Q: {question}",
@@ -77,6 +480,46 @@ class ExemplarValidator:
             ]
         )
 
+    def _iter_diffs(self, answers: Iterable[str]) -> Iterator[str]:
+        """Diff each example's answer against the matching LLM answer."""
+        for question, expected, actual in zip(self._questions, self._answers, answers):
+            yield self._create_diff(question, expected, actual)
+
+    def _replace_answers(self, answers: Iterable[str]) -> List[Dict[str, Any]]:
+        """Copy the examples, swapping in the matching LLM answers."""
+        _, example_answer_key = self._get_example_keys()
+
+        new_examples: List[Dict[str, Any]] = []
+        for example, answer in zip(self.examples, answers):
+            new_example = dict(example)
+            new_example[example_answer_key] = answer
+            new_examples.append(new_example)
+        return new_examples
+
+    def clear_cache(self) -> None:
+        """Forget the answers of previous runs and everything rendered from the prompt.
+
+        The next replay or ablation queries the LLM again, picking up any in-place
+        edits to the examples or prompt.
+        """
+        self._invalidate(_EXAMPLE_DERIVED + _PROMPT_DERIVED + _LLM_DERIVED)
+
+    def replay(self) -> tuple[str, List[Dict[str, Any]]]:
+        """Replay examples once, returning the results of both replay_test() and replay_examples().
+
+        Answers are reused by later replay calls until examples, prompt, llm,
+        batch_prompting or answer_max_tokens is reassigned, so calling
+        replay_test() and replay_examples() in turn only queries the LLM once.
+        Call clear_cache() first to query the LLM again, e.g. to check a
+        nondeterministic model or after editing the prompt in place.
+
+        Returns:
+            A (diff, examples) tuple of the replay_test() diff string and the
+            replay_examples() examples.
+        """
+        answers = list(self._replay_answers())
+        return "\n\n".join(self._iter_diffs(answers)), self._replace_answers(answers)
+
     def replay_test(self) -> str:
         """Replay examples and show diffs for all answers.
 
@@ -84,16 +527,33 @@ class ExemplarValidator:
             A diff-style string showing all examples. Identical answers are marked
             as "(identical)", mismatched answers show the diff.
         """
-        example_question_key, example_answer_key = self._get_example_keys()
+        return self.replay()[0]
 
-        diffs: List[str] = []
-        for example in self.examples:
-            question = example[example_question_key]
-            actual = self._invoke_llm(self.prompt, question)
-            expected = str(example[example_answer_key]).strip()
-            diff = self._create_diff(question, expected, actual)
-            diffs.append(diff)
-        return "\n\n".join(diffs)
+    def ireplay_test(self) -> Iterator[str]:
+        """Like replay_test(), but yield each example's diff as soon as it's ready.
+
+        Diffs are yielded in example order.
+        """
+        yield from self._iter_diffs(self._replay_answers())
+
+    async def areplay_test(self) -> str:
+        """Async counterpart of replay_test()."""
+        return "\n\n".join(self._iter_diffs(await self._areplay_answers()))
+
+    def ablation(self) -> tuple[str, List[Dict[str, Any]]]:
+        """Ablate examples once, returning the results of both ablation_test() and ablation_examples().
+
+        Answers are reused by later ablation calls until examples, prompt, llm,
+        batch_prompting or answer_max_tokens is reassigned, so calling
+        ablation_test() and ablation_examples() in turn only queries the LLM once.
+        Call clear_cache() first to query the LLM again.
+
+        Returns:
+            A (diff, examples) tuple of the ablation_test() diff string and the
+            ablation_examples() examples.
+        """
+        answers = list(self._ablation_answers())
+        return "\n\n".join(self._iter_diffs(answers)), self._replace_answers(answers)
 
     def ablation_test(self) -> str:
         """Test the impact of each example by removing it and comparing answers.
@@ -105,18 +565,18 @@ class ExemplarValidator:
             A diff-style string showing all examples. Identical answers are marked
             as "(identical)", changed answers show the diff.
         """
-        example_question_key, example_answer_key = self._get_example_keys()
+        return self.ablation()[0]
 
-        diffs: List[str] = []
-        for i, example in enumerate(self.examples):
-            ablated_prompt = self._create_ablated_prompt(i)
-            question = example[example_question_key]
-            original_answer = str(example[example_answer_key]).strip()
-            ablated_answer = self._invoke_llm(ablated_prompt, question)
-            diff = self._create_diff(question, original_answer, ablated_answer)
-            diffs.append(diff)
+    def iablation_test(self) -> Iterator[str]:
+        """Like ablation_test(), but yield each example's diff as soon as it's ready.
 
-        return "\n\n".join(diffs)
+        Diffs are yielded in example order.
+        """
+        yield from self._iter_diffs(self._ablation_answers())
+
+    async def aablation_test(self) -> str:
+        """Async counterpart of ablation_test()."""
+        return "\n\n".join(self._iter_diffs(await self._aablation_answers()))
 
     def replay_examples(self) -> List[Dict[str, Any]]:
         """Return a new set of examples with answers replayed through the same mechanism as replay_test().
@@ -127,19 +587,11 @@ class ExemplarValidator:
         Returns:
             A list of examples with replayed answers from the LLM.
         """
-        example_question_key, example_answer_key = self._get_example_keys()
-
-        replayed_examples: List[Dict[str, Any]] = []
-        for example in self.examples:
-            question = example[example_question_key]
-            replayed_answer = self._invoke_llm(self.prompt, question)
+        return self.replay()[1]
 
-            # Create new example with replayed answer
-            replayed_example = dict(example)
-            replayed_example[example_answer_key] = replayed_answer
-            replayed_examples.append(replayed_example)
-
-        return replayed_examples
+    async def areplay_examples(self) -> List[Dict[str, Any]]:
+        """Async counterpart of replay_examples()."""
+        return self._replace_answers(await self._areplay_answers())
 
     def ablation_examples(self) -> List[Dict[str, Any]]:
         """Return a new set of examples with answers rewritten through the same mechanism as ablation_test().
@@ -150,20 +602,11 @@ class ExemplarValidator:
         Returns:
             A list of examples with ablated answers from the LLM.
         """
-        example_question_key, example_answer_key = self._get_example_keys()
-
-        ablated_examples: List[Dict[str, Any]] = []
-        for i, example in enumerate(self.examples):
-            ablated_prompt = self._create_ablated_prompt(i)
-            question = example[example_question_key]
-            ablated_answer = self._invoke_llm(ablated_prompt, question)
-
-            # Create new example with ablated answer
-            ablated_example = dict(example)
-            ablated_example[example_answer_key] = ablated_answer
-            ablated_examples.append(ablated_example)
+        return self.ablation()[1]
 
-        return ablated_examples
+    async def aablation_examples(self) -> List[Dict[str, Any]]:
+        """Async counterpart of ablation_examples()."""
+        return self._replace_answers(await self._aablation_answers())
 
 
 __all__ = ["ExemplarValidator"]
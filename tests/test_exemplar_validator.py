@@ -1,4 +1,11 @@
+import asyncio
+import logging
+import threading
+import time
+
 from langchain.prompts import FewShotPromptTemplate, PromptTemplate
+from langchain_core.example_selectors import BaseExampleSelector
+from langchain_core.runnables import RunnableLambda
 
 from few_shot_exemplars.langchain_validator import ExemplarValidator
 
@@ -225,3 +232,755 @@ def test_ablation_examples_returns_ablated_examples():
     assert ablated[0]["answer"] == "Muhammad Ali (74)"
     # Second example: when removed from context, gets different answer
     assert ablated[1]["answer"] == "Tina Turner (83)"
+
+
+def test_replay_and_ablation_invoke_llm_concurrently():
+    examples = [
+        {
+            "question": "Who lived longer, Muhammad Ali or Alan Turing?",
+            "answer": "Muhammad Ali (74)",
+        },
+        {
+            "question": "Who lived longer, Tina Turner or Ruby Turner?",
+            "answer": "Tina Turner (83)",
+        },
+    ]
+    example_prompt = PromptTemplate.from_template("Question: {question}\n{answer}")
+    prompt = FewShotPromptTemplate(
+        examples=examples,
+        example_prompt=example_prompt,
+        suffix="Question: {input}",
+        input_variables=["input"],
+    )
+
+    # Both calls must be in flight at once for the barrier to release
+    barrier = threading.Barrier(len(examples), timeout=5)
+
+    def mock_llm_func(prompt_input):
+        class MockResponse:
+            def __init__(self, content):
+                self.content = content
+
+        barrier.wait()
+        last_question = prompt_input.text.split("\n")[-1]
+        if "Tina Turner or Ruby Turner" in last_question:
+            return MockResponse("Tina Turner (83)")
+        else:
+            return MockResponse("Muhammad Ali (74)")
+
+    validator = ExemplarValidator(prompt, mock_llm_func)
+
+    replayed = validator.replay_examples()
+    assert [ex["answer"] for ex in replayed] == [
+        "Muhammad Ali (74)",
+        "Tina Turner (83)",
+    ]
+
+    ablated = validator.ablation_examples()
+    assert [ex["answer"] for ex in ablated] == ["Muhammad Ali (74)", "Tina Turner (83)"]
+
+
+def test_async_methods_respect_max_concurrency():
+    examples = [
+        {
+            "question": "Who lived longer, Muhammad Ali or Alan Turing?",
+            "answer": "Muhammad Ali (74)",
+        },
+        {
+            "question": "Who lived longer, Tina Turner or Ruby Turner?",
+            "answer": "Ruby Turner (65)",
+        },
+    ]
+    example_prompt = PromptTemplate.from_template("Question: {question}\n{answer}")
+    prompt = FewShotPromptTemplate(
+        examples=examples,
+        example_prompt=example_prompt,
+        suffix="Question: {input}",
+        input_variables=["input"],
+    )
+
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    def mock_llm_func(prompt_input):
+        class MockResponse:
+            def __init__(self, content):
+                self.content = content
+
+        with lock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.pop()
+
+        last_question = prompt_input.text.split("\n")[-1]
+        if "Tina Turner or Ruby Turner" in last_question:
+            return MockResponse("Tina Turner (83)")
+        else:
+            return MockResponse("Muhammad Ali (74)")
+
+    validator = ExemplarValidator(prompt, mock_llm_func, max_concurrency=1)
+
+    diff = asyncio.run(validator.areplay_test())
+    assert "- Ruby Turner (65)" in diff
+    assert "+ Tina Turner (83)" in diff
+
+    ablated = asyncio.run(validator.aablation_examples())
+    assert [ex["answer"] for ex in ablated] == ["Muhammad Ali (74)", "Tina Turner (83)"]
+    assert max(peak) == 1
+
+
+def test_batch_prompting_replays_in_one_call():
+    examples = [
+        {
+            "question": "Who lived longer, Muhammad Ali or Alan Turing?",
+            "answer": "Muhammad Ali (74)",
+        },
+        {
+            "question": "Who lived longer, Tina Turner or Ruby Turner?",
+            "answer": "Ruby Turner (65)",
+        },
+    ]
+    example_prompt = PromptTemplate.from_template("Question: {question}\nA: {answer}")
+    prompt = FewShotPromptTemplate(
+        examples=examples,
+        example_prompt=example_prompt,
+        suffix="Question: {input}",
+        input_variables=["input"],
+    )
+
+    calls = []
+
+    def mock_llm_func(prompt_input):
+        class MockResponse:
+            def __init__(self, content):
+                self.content = content
+
+        calls.append(prompt_input.text)
+        if "1. Who lived longer, Muhammad Ali" in prompt_input.text:
+            return MockResponse("1. A: Muhammad Ali (74)\n2. A: Tina Turner (83)")
+        return MockResponse("unparseable")
+
+    validator = ExemplarValidator(prompt, mock_llm_func, batch_prompting=True)
+    replayed = validator.replay_examples()
+
+    assert len(calls) == 1
+    assert [ex["answer"] for ex in replayed] == [
+        "Muhammad Ali (74)",
+        "Tina Turner (83)",
+    ]
+
+
+def test_batch_prompting_falls_back_to_single_calls():
+    examples = [
+        {
+            "question": "Who lived longer, Muhammad Ali or Alan Turing?",
+            "answer": "Muhammad Ali (74)",
+        },
+        {
+            "question": "Who lived longer, Tina Turner or Ruby Turner?",
+            "answer": "Ruby Turner (65)",
+        },
+    ]
+    example_prompt = PromptTemplate.from_template("Question: {question}\n{answer}")
+    prompt = FewShotPromptTemplate(
+        examples=examples,
+        example_prompt=example_prompt,
+        suffix="Question: {input}",
+        input_variables=["input"],
+    )
+
+    def mock_llm_func(prompt_input):
+        class MockResponse:
+            def __init__(self, content):
+                self.content = content
+
+        # Ignores the numbered-list format, so the batch can't be split
+        last_question = prompt_input.text.split("\n")[-1]
+        if "Tina Turner or Ruby Turner" in last_question:
+            return MockResponse("Tina Turner (83)")
+        else:
+            return MockResponse("Muhammad Ali (74)")
+
+    validator = ExemplarValidator(prompt, mock_llm_func, batch_prompting=True)
+    diff = validator.replay_test()
+
+    assert "- Ruby Turner (65)" in diff
+    assert "+ Tina Turner (83)" in diff
+
+
+def test_ireplay_test_yields_one_diff_per_example():
+    examples = [
+        {
+            "question": "Who lived longer, Muhammad Ali or Alan Turing?",
+            "answer": "Muhammad Ali (74)",
+        },
+        {
+            "question": "Who lived longer, Tina Turner or Ruby Turner?",
+            "answer": "Ruby Turner (65)",
+        },
+    ]
+    example_prompt = PromptTemplate.from_template("Question: {question}\n{answer}")
+    prompt = FewShotPromptTemplate(
+        examples=examples,
+        example_prompt=example_prompt,
+        suffix="Question: {input}",
+        input_variables=["input"],
+    )
+
+    def mock_llm_func(prompt_input):
+        class MockResponse:
+            def __init__(self, content):
+                self.content = content
+
+        last_question = prompt_input.text.split("\n")[-1]
+        if "Tina Turner or Ruby Turner" in last_question:
+            return MockResponse("Tina Turner (83)")
+        else:
+            return MockResponse("Muhammad Ali (74)")
+
+    validator = ExemplarValidator(prompt, mock_llm_func)
+    diffs = list(validator.ireplay_test())
+
+    assert len(diffs) == 2
+    assert "(identical)" in diffs[0]
+    assert "+ Tina Turner (83)" in diffs[1]
+    assert "\n\n".join(diffs) == validator.replay_test()
+
+
+def test_replay_test_dedupes_identical_prompts():
+    examples = [
+        {
+            "question": "Who lived longer, Tina Turner or Ruby Turner?",
+            "answer": "Tina Turner (83)",
+        },
+        {
+            "question": "Who lived longer, Tina Turner or Ruby Turner?",
+            "answer": "Ruby Turner (65)",
+        },
+    ]
+    example_prompt = PromptTemplate.from_template("Question: {question}\n{answer}")
+    prompt = FewShotPromptTemplate(
+        examples=examples,
+        example_prompt=example_prompt,
+        suffix="Question: {input}",
+        input_variables=["input"],
+    )
+
+    calls = []
+
+    def mock_llm_func(prompt_input):
+        class MockResponse:
+            def __init__(self, content):
+                self.content = content
+
+        calls.append(prompt_input.text)
+        return MockResponse("Tina Turner (83)")
+
+    validator = ExemplarValidator(prompt, mock_llm_func)
+    diff = validator.replay_test()
+
+    assert len(calls) == 1
+    assert "# (identical)" in diff
+    assert "- Ruby Turner (65)" in diff
+
+    asyncio.run(ExemplarValidator(prompt, mock_llm_func).areplay_test())
+    assert len(calls) == 2
+
+
+def test_rendered_prefix_matches_formatted_prompt():
+    examples = [
+        {
+            "question": "Who lived longer, Muhammad Ali or Alan Turing?",
+            "answer": "Muhammad Ali (74)",
+        },
+    ]
+    example_prompt = PromptTemplate.from_template("Question: {question}\n{answer}")
+    prompt = FewShotPromptTemplate(
+        examples=examples,
+        example_prompt=example_prompt,
+        prefix="Answer briefly",
+        suffix="Question: {input}",
+        input_variables=["input"],
+    )
+
+    validator = ExemplarValidator(prompt, lambda _: None)
+    question = "Who outlived who: Robin or Maurice Gibb?"
+
+    assert validator.rendered_prefix.startswith("Answer briefly")
+    assert validator.rendered_prefix.endswith("Question: ")
+    assert validator.rendered_prefix + question == prompt.format(input=question)
+
+
+def test_selector_prompt_has_no_rendered_prefix(caplog):
+    examples = [
+        {
+            "question": "Who lived longer, Muhammad Ali or Alan Turing?",
+            "answer": "Muhammad Ali (74)",
+        },
+        {
+            "question": "Who lived longer, Tina Turner or Ruby Turner?",
+            "answer": "Tina Turner (83)",
+        },
+    ]
+
+    class MatchingExampleSelector(BaseExampleSelector):
+        def __init__(self):
+            self.selected_for = []
+
+        def add_example(self, example):
+            raise NotImplementedError
+
+        def select_examples(self, input_variables):
+            self.selected_for.append(input_variables["input"])
+            return [e for e in examples if e["question"] != input_variables["input"]]
+
+    selector = MatchingExampleSelector()
+    example_prompt = PromptTemplate.from_template("Question: {question}\n{answer}")
+    prompt = FewShotPromptTemplate(
+        example_selector=selector,
+        example_prompt=example_prompt,
+        suffix="Question: {input}",
+        input_variables=["input"],
+    )
+
+    received = []
+
+    def mock_llm_func(prompt_input):
+        class MockResponse:
+            def __init__(self, content):
+                self.content = content
+
+        received.append(prompt_input.text)
+        return MockResponse("Muhammad Ali (74)")
+
+    with caplog.at_level(logging.DEBUG, logger="few_shot_exemplars"):
+        validator = ExemplarValidator(prompt, mock_llm_func, examples=examples)
+
+    # Nothing is rendered, so the selector isn't run, until questions are replayed
+    assert validator.rendered_prefix is None
+    assert selector.selected_for == []
+    assert "sha256" not in caplog.text
+
+    validator.replay_test()
+    questions = [example["question"] for example in examples]
+    assert sorted(selector.selected_for) == sorted(questions)
+    assert sorted(received) == sorted(prompt.format(input=q) for q in questions)
+
+
+def test_replay_only_strips_leading_prompt_prefix():
+    examples = [
+        {
+            "question": "Which grade did the essay get?",
+            "answer": "A: excellent",
+        },
+    ]
+    example_prompt = PromptTemplate.from_template("Q: {question}\nA: {answer}")
+    prompt = FewShotPromptTemplate(
+        examples=examples,
+        example_prompt=example_prompt,
+        suffix="Q: {input}",
+        input_variables=["input"],
+    )
+
+    def mock_llm_func(_):
+        class MockResponse:
+            def __init__(self, content):
+                self.content = content
+
+        return MockResponse("A: Grade A: excellent")
+
+    validator = ExemplarValidator(prompt, mock_llm_func)
+    replayed = validator.replay_examples()
+
+    assert replayed[0]["answer"] == "Grade A: excellent"
+
+
+def test_answer_max_tokens_is_bound_to_llm():
+    examples = [
+        {
+            "question": "Who lived longer, Muhammad Ali or Alan Turing?",
+            "answer": "Muhammad Ali (74)",
+        },
+        {
+            "question": "Who lived longer, Tina Turner or Ruby Turner?",
+            "answer": "Tina Turner (83)",
+        },
+    ]
+    example_prompt = PromptTemplate.from_template("Question: {question}\n{answer}")
+    prompt = FewShotPromptTemplate(
+        examples=examples,
+        example_prompt=example_prompt,
+        suffix="Question: {input}",
+        input_variables=["input"],
+    )
+
+    max_tokens = []
+
+    def mock_llm_func(prompt_input, **kwargs):
+        class MockResponse:
+            def __init__(self, content):
+                self.content = content
+
+        max_tokens.append(kwargs["max_tokens"])
+        return MockResponse("Muhammad Ali (74)")
+
+    llm = RunnableLambda(mock_llm_func)
+
+    ExemplarValidator(prompt, llm, answer_max_tokens=16).replay_test()
+    assert max_tokens == [16, 16]
+
+    max_tokens.clear()
+    ExemplarValidator(
+        prompt, llm, batch_prompting=True, answer_max_tokens=16
+    ).replay_test()
+    # The batched call has room for both answers before falling back
+    assert max_tokens == [32, 16, 16]
+
+    # Reassigning either setting re-queries the LLM instead of reusing answers
+    validator = ExemplarValidator(prompt, llm, answer_max_tokens=16)
+    validator.replay_test()
+    max_tokens.clear()
+    validator.answer_max_tokens = 8
+    validator.replay_test()
+    assert max_tokens == [8, 8]
+
+    max_tokens.clear()
+    validator.batch_prompting = True
+    validator.replay_test()
+    assert max_tokens == [16, 8, 8]
+
+
+def test_replay_and_ablation_results_are_reused_until_examples_change():
+    examples = [
+        {
+            "question": "Who lived longer, Muhammad Ali or Alan Turing?",
+            "answer": "Muhammad Ali (74)",
+        },
+        {
+            "question": "Who lived longer, Tina Turner or Ruby Turner?",
+            "answer": "Ruby Turner (65)",
+        },
+    ]
+    example_prompt = PromptTemplate.from_template("Question: {question}\n{answer}")
+    prompt = FewShotPromptTemplate(
+        examples=examples,
+        example_prompt=example_prompt,
+        suffix="Question: {input}",
+        input_variables=["input"],
+    )
+
+    calls = []
+
+    def mock_llm_func(prompt_input):
+        class MockResponse:
+            def __init__(self, content):
+                self.content = content
+
+        calls.append(prompt_input.text)
+        last_question = prompt_input.text.split("\n")[-1]
+        if "Tina Turner or Ruby Turner" in last_question:
+            return MockResponse("Tina Turner (83)")
+        else:
+            return MockResponse("Muhammad Ali (74)")
+
+    validator = ExemplarValidator(prompt, mock_llm_func)
+
+    diff, replayed = validator.replay()
+    assert "+ Tina Turner (83)" in diff
+    assert replayed[1]["answer"] == "Tina Turner (83)"
+    assert len(calls) == 2
+
+    assert validator.replay_test() == diff
+    assert validator.replay_examples() == replayed
+    assert list(validator.ireplay_test()) == diff.split("\n\n")
+    assert len(calls) == 2
+
+    validator.ablation_test()
+    validator.ablation_examples()
+    assert len(calls) == 4
+
+    validator.examples = examples[1:]
+    diff = validator.replay_test()
+    assert diff.startswith("# Q: Who lived longer, Tina Turner or Ruby Turner?")
+    assert "Muhammad Ali" not in diff
+    assert len(calls) == 5
+
+
+def test_clear_cache_queries_llm_again():
+    examples = [
+        {
+            "question": "Who lived longer, Muhammad Ali or Alan Turing?",
+            "answer": "Muhammad Ali (74)",
+        },
+    ]
+    example_prompt = PromptTemplate.from_template("Question: {question}\n{answer}")
+    prompt = FewShotPromptTemplate(
+        examples=examples,
+        example_prompt=example_prompt,
+        suffix="Question: {input}",
+        input_variables=["input"],
+    )
+
+    received = []
+
+    def mock_llm_func(prompt_input):
+        class MockResponse:
+            def __init__(self, content):
+                self.content = content
+
+        received.append(prompt_input.text)
+        return MockResponse(f"Muhammad Ali ({74 + len(received)})")
+
+    validator = ExemplarValidator(prompt, mock_llm_func)
+    assert "+ Muhammad Ali (75)" in validator.replay_test()
+    assert "+ Muhammad Ali (75)" in validator.replay_test()
+
+    validator.clear_cache()
+    assert "+ Muhammad Ali (76)" in validator.replay_test()
+
+    validator.ablation_test()
+    validator.clear_cache()
+    validator.ablation_test()
+    assert len(received) == 4
+
+    # In-place edits are picked up once the cache is cleared
+    prompt.prefix = "Answer briefly"
+    validator.clear_cache()
+    validator.replay_test()
+    assert received[-1] == prompt.format(input=examples[0]["question"])
+
+
+def test_reassigning_prompt_and_llm_takes_effect():
+    examples = [
+        {
+            "question": "Who lived longer, Muhammad Ali or Alan Turing?",
+            "answer": "Muhammad Ali (74)",
+        },
+    ]
+    example_prompt = PromptTemplate.from_template("Question: {question}\n{answer}")
+    prompt = FewShotPromptTemplate(
+        examples=examples,
+        example_prompt=example_prompt,
+        suffix="Question: {input}",
+        input_variables=["input"],
+    )
+
+    class MockResponse:
+        def __init__(self, content):
+            self.content = content
+
+    received = []
+
+    def mock_llm_func(prompt_input):
+        received.append(prompt_input.text)
+        return MockResponse("Muhammad Ali (74)")
+
+    validator = ExemplarValidator(prompt, mock_llm_func)
+    assert "# (identical)" in validator.replay_test()
+
+    validator.llm = lambda _: MockResponse("Alan Turing (41)")
+    diff = validator.replay_test()
+    assert "+ Alan Turing (41)" in diff
+    assert "+ Alan Turing (41)" in validator.ablation_test()
+
+    fixed_prompt = prompt.model_copy(update={"prefix": "Answer briefly"})
+    validator.prompt = fixed_prompt
+    validator.llm = mock_llm_func
+    question = examples[0]["question"]
+    assert "# (identical)" in validator.replay_test()
+    assert validator.rendered_prefix.startswith("Answer briefly")
+    assert received[-1] == fixed_prompt.format(input=question)
+
+
+def test_long_answers_get_line_level_diff():
+    unchanged = [f"Step {n}: carry on as before." for n in range(1, 13)]
+    examples = [
+        {
+            "question": "How do I reset my password?",
+            "answer": "\n".join(unchanged + ["Finally, restart the router."]),
+        },
+    ]
+    example_prompt = PromptTemplate.from_template("Question: {question}\n{answer}")
+    prompt = FewShotPromptTemplate(
+        examples=examples,
+        example_prompt=example_prompt,
+        suffix="Question: {input}",
+        input_variables=["input"],
+    )
+
+    def mock_llm_func(_):
+        class MockResponse:
+            def __init__(self, content):
+                self.content = content
+
+        return MockResponse("\n".join(unchanged + ["Finally, log in again."]))
+
+    validator = ExemplarValidator(prompt, mock_llm_func)
+    diff = validator.replay_test()
+
+    assert diff.startswith("# Q: How do I reset my password?\n--- expected\n+++ actual")
+    assert "-Finally, restart the router." in diff
+    assert "+Finally, log in again." in diff
+    # Only the context around the change is repeated, not every unchanged line
+    assert "Step 1:" not in diff
+
+
+def test_long_single_line_answers_keep_short_diff():
+    examples = [
+        {
+            "question": "Describe the router.",
+            "answer": "A small grey box " * 20,
+        },
+    ]
+    example_prompt = PromptTemplate.from_template("Question: {question}\n{answer}")
+    prompt = FewShotPromptTemplate(
+        examples=examples,
+        example_prompt=example_prompt,
+        suffix="Question: {input}",
+        input_variables=["input"],
+    )
+
+    def mock_llm_func(_):
+        class MockResponse:
+            def __init__(self, content):
+                self.content = content
+
+        return MockResponse("A small black box " * 20)
+
+    diff = ExemplarValidator(prompt, mock_llm_func).replay_test()
+
+    assert diff == "\n".join(
+        [
+            "# Q: Describe the router.",
+            "- " + ("A small grey box " * 20).strip(),
+            "+ " + ("A small black box " * 20).strip(),
+        ]
+    )
+
+
+def test_long_answers_differing_only_in_line_endings_still_show_diff():
+    unchanged = [f"Step {n}: carry on as before." for n in range(1, 13)]
+    examples = [
+        {
+            "question": "How do I reset my password?",
+            "answer": "\n".join(unchanged),
+        },
+    ]
+    example_prompt = PromptTemplate.from_template("Question: {question}\n{answer}")
+    prompt = FewShotPromptTemplate(
+        examples=examples,
+        example_prompt=example_prompt,
+        suffix="Question: {input}",
+        input_variables=["input"],
+    )
+
+    def mock_llm_func(_):
+        class MockResponse:
+            def __init__(self, content):
+                self.content = content
+
+        return MockResponse("\r\n".join(unchanged))
+
+    validator = ExemplarValidator(prompt, mock_llm_func)
+    diff = validator.replay_test()
+
+    assert diff == "\n".join(
+        [
+            "# Q: How do I reset my password?",
+            "- " + "\n".join(unchanged),
+            "+ " + "\r\n".join(unchanged),
+        ]
+    )
+
+
+def test_llm_receives_same_text_as_formatted_prompt():
+    examples = [
+        {
+            "question": "Who lived longer, Muhammad Ali or Alan Turing?",
+            "answer": "Muhammad Ali (74)",
+        },
+        {
+            "question": "Who lived longer, Tina Turner or Ruby Turner?",
+            "answer": "Tina Turner (83)",
+        },
+    ]
+    example_prompt = PromptTemplate.from_template("Question: {question}\n{answer}")
+    prompt = FewShotPromptTemplate(
+        examples=examples,
+        example_prompt=example_prompt,
+        prefix="Answer briefly",
+        suffix="Question: {input}\n(Repeat: {input})",
+        input_variables=["input"],
+    )
+
+    received = []
+
+    def mock_llm_func(prompt_input):
+        class MockResponse:
+            def __init__(self, content):
+                self.content = content
+
+        received.append(prompt_input.text)
+        return MockResponse("Muhammad Ali (74)")
+
+    validator = ExemplarValidator(prompt, mock_llm_func)
+    validator.replay_test()
+    validator.ablation_test()
+
+    questions = [example["question"] for example in examples]
+    replayed = [prompt.format(input=question) for question in questions]
+    ablated = [
+        prompt.model_copy(update={"examples": [examples[1 - i]]}).format(input=question)
+        for i, question in enumerate(questions)
+    ]
+    assert sorted(received) == sorted(replayed + ablated)
+
+
+def test_prompts_that_cannot_be_spliced_are_rendered_in_full():
+    examples = [
+        {
+            "question": "Who lived longer, Muhammad Ali or Alan Turing?",
+            "answer": "Muhammad Ali (74)",
+        },
+        {
+            "question": "Who lived longer, Tina Turner or Ruby Turner?",
+            "answer": "Tina Turner (83)",
+        },
+    ]
+    example_prompt = PromptTemplate.from_template("Question: {question}\n{answer}")
+    calls = iter(range(1, 100))
+    prompt = FewShotPromptTemplate(
+        examples=examples,
+        example_prompt=example_prompt,
+        suffix="Call {call}\nQuestion: {input!r}",
+        input_variables=["input"],
+        partial_variables={"call": lambda: next(calls)},
+    )
+
+    received = []
+
+    def mock_llm_func(prompt_input):
+        class MockResponse:
+            def __init__(self, content):
+                self.content = content
+
+        received.append(prompt_input.text)
+        return MockResponse("Muhammad Ali (74)")
+
+    ExemplarValidator(prompt, mock_llm_func).replay_test()
+
+    questions = [example["question"] for example in examples]
+    # The !r conversion is applied to the real question
+    assert all(any(repr(q) in text for text in received) for q in questions)
+    # The callable partial is evaluated for each render, not frozen once
+    assert len({text.split("\n")[-2] for text in received}) == 2
+
+    received.clear()
+    prompt = prompt.model_copy(
+        update={"partial_variables": {}, "suffix": "Question: {input!r}"}
+    )
+    ExemplarValidator(prompt, mock_llm_func).replay_test()
+    assert sorted(received) == sorted(prompt.format(input=q) for q in questions)